@@ -17,29 +17,69 @@ RapidAPI Endpoint: https://rapidapi.com/KanjiAlive/api/learn-to-read-and-write-j
 """
 
 import asyncio
+import copy
 import json
 import logging
 import datetime
+import functools
 import os
 import random
 import re
 import sys
+import time
 import unicodedata
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-from urllib.parse import quote
+from types import MappingProxyType
+from typing import Annotated, Optional, List, Dict, Any, Mapping, NamedTuple, Tuple
+from urllib.parse import quote, quote_from_bytes, urlencode
 
 import httpx
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import CallToolResult, TextContent
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+# orjson is an optional speedup for JSON parsing; fall back to the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 support in httpx requires the optional h2 package
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 # Constants
 API_BASE_URL = "https://kanjialive-api.p.rapidapi.com/api/public"
 REQUEST_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 10.0
+# All requests go to a single host, so keep a small pool of long-lived connections
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 60.0
+# Transport-level retries for failed connection attempts (DNS, TCP connect)
+CONNECT_RETRIES = 1
+# Retries for rate limiting (429), server errors (5xx) and network errors
+MAX_RETRIES = 3
+MAX_BACKOFF = 30.0
+# Kanji Alive data is static, so successful search responses are cached in memory
+RESPONSE_CACHE_SIZE = 512
+# Filtered kanji details, keyed by character (large enough for all 1,235 kanji)
+DETAIL_CACHE_SIZE = 2048
+# Cached entries expire after an hour so upstream corrections are eventually picked up
+CACHE_TTL = 3600.0
+# Batch detail lookups: maximum characters per call, and concurrent API requests
+# kept low enough not to trip RapidAPI rate limits on a single batch
+MAX_BATCH_CHARACTERS = 50
+BATCH_CONCURRENCY = 8
 RAPIDAPI_HOST = "kanjialive-api.p.rapidapi.com"
 USER_AGENT = "kanjialive-mcp/1.0 (+https://github.com/kanjialive-mcp-server)"
 
@@ -49,8 +89,28 @@ logger = logging.getLogger(__name__)
 # Data directory for bundled reference data
 DATA_DIR = Path(__file__).parent / "data"
 
-# Cached radicals data (loaded once on first access)
-_RADICALS_CACHE: Optional[Dict[str, Any]] = None
+# Radicals data pre-serialized for the radicals resource (built once at startup)
+_RADICALS_JSON: Optional[str] = None
+
+# LRU caches hold (expiry time, value) entries, see _lru_get() and _lru_put()
+# Successful search responses keyed by (endpoint, sorted params); kanji detail
+# responses are cached after filtering, in _DETAIL_CACHE
+_RESPONSE_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+
+# Filtered kanji detail data keyed by normalized character
+_DETAIL_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Hit/miss counters for both caches, reported by the cache stats resource
+_CACHE_STATS: Dict[str, int] = {
+    "response_hits": 0,
+    "response_misses": 0,
+    "detail_hits": 0,
+    "detail_misses": 0,
+}
+
+# In-flight requests keyed like the response cache: concurrent identical
+# requests await the same future, so they share one upstream call and its outcome
+_INFLIGHT_REQUESTS: Dict[Tuple[Any, ...], "_InflightRequest"] = {}
 
 
 def _load_radicals_data_from_file() -> Dict[str, Any]:
@@ -58,7 +118,7 @@ def _load_radicals_data_from_file() -> Dict[str, Any]:
     Load the Japanese radicals reference data from bundled JSON file.
 
     This is the actual file loading logic, called once during server startup.
-    After startup, use _get_radicals_cache() to access the cached data.
+    After startup, use _get_radicals_json() to access the serialized data.
 
     Returns:
         Dict containing radicals data with metadata and radical entries
@@ -69,45 +129,47 @@ def _load_radicals_data_from_file() -> Dict[str, Any]:
     """
     radicals_file = DATA_DIR / "japanese-radicals.json"
 
-    if not radicals_file.exists():
+    # Read raw bytes: both orjson and json parse UTF-8 bytes directly,
+    # skipping an intermediate str decode of the whole file
+    try:
+        raw = radicals_file.read_bytes()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Radicals data file not found: {radicals_file}. "
             f"Run 'python extras/scripts/convert_radicals_csv.py' to generate it."
-        )
+        ) from None
 
     try:
-        with open(radicals_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _json_loads(raw)
     except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(
+        # Re-raise the original error rather than wrapping it, so the file
+        # contents held in e.doc are not copied into a second exception
+        logger.error(
             f"Corrupted radicals data file: {radicals_file}. "
-            f"The JSON file is malformed and cannot be parsed. "
-            f"Original error: {e.msg}",
-            e.doc,
-            e.pos
+            f"The JSON file is malformed at position {e.pos}: {e.msg}"
         )
+        raise
 
     logger.info(f"Loaded {data.get('total_entries', 0)} radicals from {radicals_file}")
     return data
 
 
-def _get_radicals_cache() -> Dict[str, Any]:
+def _get_radicals_json() -> str:
     """
-    Get the radicals cache, which must have been initialized at startup.
+    Get the pre-serialized radicals JSON, which must have been built at startup.
 
     Returns:
-        Dict containing radicals data
+        Radicals data as a compact JSON string
 
     Raises:
-        RuntimeError: If cache was not initialized during server startup
+        RuntimeError: If the JSON was not built during server startup
     """
-    if _RADICALS_CACHE is None:
+    if _RADICALS_JSON is None:
         raise RuntimeError(
             "Radicals cache not initialized. "
             "This should have been loaded during server startup."
         )
-    return _RADICALS_CACHE
-
+    return _RADICALS_JSON
 
 
 @dataclass
@@ -128,22 +190,38 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     - Fail fast if the data file is missing or corrupted
     - Avoid race conditions from lazy-loading
     """
-    global _RADICALS_CACHE
+    global _RADICALS_JSON
 
     # Load radicals cache at startup (fail-fast on missing/corrupted file)
     try:
-        _RADICALS_CACHE = _load_radicals_data_from_file()
+        radicals_data = _load_radicals_data_from_file()
+        # The data is static, so serialize it once rather than on every resource read.
+        # Compact separators: the consumer is an LLM, and whitespace costs tokens.
+        _RADICALS_JSON = json.dumps(radicals_data, ensure_ascii=False, separators=(',', ':'))
         logger.info("Radicals cache initialized successfully")
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logger.error(f"Failed to load radicals data: {e}")
         raise
 
-    headers = _get_api_headers()
+    # Pool settings go on the transport: httpx ignores client-level
+    # http2/limits arguments when an explicit transport is supplied
+    transport = httpx.AsyncHTTPTransport(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        ),
+        retries=CONNECT_RETRIES
+    )
+    # No explicit Accept-Encoding: httpx advertises exactly the codings it can
+    # decode (gzip, deflate, and br when the optional brotli package is installed)
     client = httpx.AsyncClient(
-        timeout=REQUEST_TIMEOUT,
-        headers=headers
+        transport=transport,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        headers=_get_api_headers()
     )
-    logger.debug("Created HTTP client for server lifespan")
+    logger.debug(f"Created HTTP client for server lifespan (HTTP/2: {_HTTP2_AVAILABLE})")
     try:
         yield AppContext(client=client)
     finally:
@@ -163,12 +241,16 @@ mcp = FastMCP(
     lifespan=app_lifespan
 )
 
-def _get_api_headers() -> Dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def _get_api_headers() -> Mapping[str, str]:
     """
-    Get API headers with runtime key validation.
+    Build API headers with runtime key validation.
+
+    Reads RAPIDAPI_KEY from the environment. The result is memoized, so the
+    startup key check and the lifespan client share one headers mapping.
 
     Returns:
-        Dict of HTTP headers for RapidAPI requests
+        Read-only mapping of HTTP headers for RapidAPI requests
 
     Raises:
         ValueError: If RAPIDAPI_KEY is not configured
@@ -181,12 +263,24 @@ def _get_api_headers() -> Dict[str, str]:
             "https://rapidapi.com/KanjiAlive/api/learn-to-read-and-write-japanese-kanji"
         )
 
-    return {
+    # Read-only, since the memoized mapping is shared by every caller
+    return MappingProxyType({
         "X-RapidAPI-Key": key,
         "X-RapidAPI-Host": RAPIDAPI_HOST,
         "Accept": "application/json",
         "User-Agent": USER_AGENT
-    }
+    })
+
+# Only inputs up to this length are memoized, so the cache cannot pin large strings
+# (matches the basic search query limit; readings and kanji are far shorter)
+_NFKC_CACHE_MAX_LENGTH = 100
+
+
+@functools.lru_cache(maxsize=1024)
+def _nfkc(text: str) -> str:
+    """Apply NFKC normalization, memoized for repeated short query strings."""
+    return unicodedata.normalize('NFKC', text)
+
 
 def _normalize_japanese_text(text: str) -> str:
     """
@@ -204,14 +298,45 @@ def _normalize_japanese_text(text: str) -> str:
     """
     if not isinstance(text, str):
         return str(text)
-    return unicodedata.normalize('NFKC', text)
+    # NFKC leaves ASCII unchanged, so romaji and English input skip normalization
+    if text.isascii():
+        return text
+    if len(text) > _NFKC_CACHE_MAX_LENGTH:
+        return unicodedata.normalize('NFKC', text)
+    return _nfkc(text)
 
 # Markdown escaping - characters that have special meaning in markdown
 # Includes: \ ` * _ { } [ ] ( ) # + - . ! | > < ~
 # Note: We escape all these characters conservatively to prevent formatting issues.
 # While some characters only have special meaning in specific contexts (e.g., - and .
 # at line start for lists), escaping them everywhere is safer for untrusted content.
-_MD_SPECIAL = re.compile(r'([\\`*_{}[\]()#+\-.!|><~])')
+_MD_ESCAPE_TABLE = str.maketrans({c: '\\' + c for c in '\\`*_{}[]()#+-.!|><~'})
+
+# Maximum number of example words rendered in kanji detail markdown
+MAX_DETAIL_EXAMPLES = 15
+
+# Shared read-only default for nested .get() lookups on API responses
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Reading separators plus surrounding whitespace: romaji and onyomi katakana
+# use the ASCII comma; kunyomi hiragana may also use the Japanese comma (、)
+_READING_SPLIT_RE = re.compile(r'\s*,\s*')
+_KUNYOMI_KANA_SPLIT_RE = re.compile(r'\s*[,、]\s*')
+
+
+def _split_readings(readings: str, split_re: "re.Pattern[str]" = _READING_SPLIT_RE) -> List[str]:
+    """
+    Split a comma-separated readings string into trimmed, non-empty readings.
+
+    Args:
+        readings: Readings string from the API (e.g. "oya, shita.shii")
+        split_re: Separator pattern, _KUNYOMI_KANA_SPLIT_RE for kunyomi kana
+
+    Returns:
+        List[str]: Individual readings in their original order
+    """
+    return [r for r in split_re.split(readings.strip()) if r]
+
 
 def _escape_markdown(text: str) -> str:
     """
@@ -232,17 +357,17 @@ def _escape_markdown(text: str) -> str:
     """
     if not isinstance(text, str):
         return str(text)
-    return _MD_SPECIAL.sub(r'\\\1', text)
+    return text.translate(_MD_ESCAPE_TABLE)
 
 # Validation constants for radical positions
-VALID_RADICAL_POSITIONS = {
+VALID_RADICAL_POSITIONS = frozenset({
     # Romaji (lowercase)
     'hen', 'tsukuri', 'kanmuri', 'ashi', 'kamae', 'tare', 'nyou',
     # Hiragana
     'へん', 'つくり', 'かんむり', 'あし', 'かまえ', 'たれ', 'にょう'
-}
+})
 
-RPOS_NORMALIZE = {
+RPOS_NORMALIZE = MappingProxyType({
     'へん': 'hen',
     'つくり': 'tsukuri',
     'かんむり': 'kanmuri',
@@ -250,7 +375,36 @@ RPOS_NORMALIZE = {
     'かまえ': 'kamae',
     'たれ': 'tare',
     'にょう': 'nyou'
-}
+})
+
+# Every valid position (romaji or hiragana) mapped to its canonical romaji form
+_RPOS_LOOKUP = MappingProxyType({
+    position: RPOS_NORMALIZE.get(position, position)
+    for position in VALID_RADICAL_POSITIONS
+})
+
+# Character sets for romaji reading validation; a set membership scan
+# beats the regex engine on these short ASCII strings
+_ASCII_LETTERS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+# Romaji (ASCII letters, hyphens for compounds)
+_ONYOMI_ROMAJI_CHARS = frozenset(_ASCII_LETTERS + '-')
+# Romaji (ASCII letters, dots for okurigana, hyphens)
+_KUN_ROMAJI_CHARS = frozenset(_ASCII_LETTERS + '.-')
+
+# Precompiled patterns for reading and study list validation
+# Katakana (including middle dot, iteration marks)
+_ONYOMI_KATAKANA_RE = re.compile(r'^[\u30A0-\u30FF\u30FB-\u30FE・]+$')
+# Hiragana (including iteration marks, small kana, dots for okurigana)
+_KUN_HIRAGANA_RE = re.compile(r'^[\u3040-\u309F\u3099-\u309C.・]+$')
+# Study list chapter ('c' followed by a number)
+_CHAPTER_RE = re.compile(r'^c\d+$')
+
+# C0 control codes except tab, newline and carriage return, plus C1 control codes
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]')
+# The ASCII subset of the above, as a bytes.translate() deletion table
+_ASCII_CONTROL_BYTES = bytes(
+    c for c in range(0x80) if (c < 0x20 and c not in (0x09, 0x0A, 0x0D)) or c == 0x7F
+)
 
 
 def _validate_no_control_chars(text: str, field_name: str = "input") -> str:
@@ -278,21 +432,20 @@ def _validate_no_control_chars(text: str, field_name: str = "input") -> str:
             f"Please remove any null characters from your input."
         )
 
+    # Fast path for ASCII input: if deleting control bytes removes nothing, it is clean
+    if text.isascii():
+        encoded = text.encode('ascii')
+        if len(encoded.translate(None, _ASCII_CONTROL_BYTES)) == len(encoded):
+            return text
+
     # Check for other control characters (C0 and C1 control codes)
-    for i, char in enumerate(text):
-        code = ord(char)
-        # C0 control codes (0x00-0x1F) except common whitespace (tab, newline, carriage return)
-        if code < 0x20 and code not in (0x09, 0x0A, 0x0D):
-            raise ValueError(
-                f"Invalid {field_name}: contains control character (U+{code:04X}) at position {i}. "
-                f"Please use only printable characters."
-            )
-        # C1 control codes (0x7F-0x9F)
-        if 0x7F <= code <= 0x9F:
-            raise ValueError(
-                f"Invalid {field_name}: contains control character (U+{code:04X}) at position {i}. "
-                f"Please use only printable characters."
-            )
+    match = _CONTROL_CHARS_RE.search(text)
+    if match:
+        code = ord(match.group())
+        raise ValueError(
+            f"Invalid {field_name}: contains control character (U+{code:04X}) at position {match.start()}. "
+            f"Please use only printable characters."
+        )
 
     return text
 
@@ -314,21 +467,81 @@ def _is_kanji_character(char: str) -> bool:
     if len(char) != 1:
         return False
     code_point = ord(char)
-    # CJK Unified Ideographs (common kanji)
-    if 0x4E00 <= code_point <= 0x9FFF:
-        return True
-    # CJK Unified Ideographs Extension A (rare kanji)
-    if 0x3400 <= code_point <= 0x4DBF:
-        return True
-    return False
+    # CJK Unified Ideographs (common kanji), then Extension A (rare kanji)
+    return 0x4E00 <= code_point <= 0x9FFF or 0x3400 <= code_point <= 0x4DBF
+
+
+def _validate_reading(
+    v: str,
+    romaji_chars: frozenset,
+    kana_re: re.Pattern,
+    error_template: str
+) -> str:
+    """
+    Validate a reading that must be either romaji or a single kana script.
+
+    Args:
+        v: The reading to validate
+        romaji_chars: Characters allowed in a romaji reading
+        kana_re: Pattern a kana reading must fully match
+        error_template: Error message with a {reading} placeholder
+
+    Returns:
+        The normalized reading, lowercased if it is romaji
+
+    Raises:
+        ValueError: If the reading is neither valid romaji nor valid kana
+    """
+    # Normalize Unicode before validation
+    v = _normalize_japanese_text(v)
+
+    # Romaji is pure ASCII, so only non-ASCII input needs the kana scan
+    if v and v.isascii() and romaji_chars.issuperset(v):
+        # Normalize romaji to lowercase for consistency
+        return v.lower()
+    if kana_re.match(v) is None:
+        raise ValueError(error_template.format(reading=v))
+    return v
+
+
+def _validate_kanji_or_text(v: str, field_name: str, expect_kanji: bool = False) -> str:
+    """
+    Validate and normalize a text or kanji input field in one pass.
+
+    Input models set str_strip_whitespace=True, so values arrive here
+    already stripped. This rejects control characters, applies NFKC
+    normalization and, if requested, checks that the result is a kanji.
+
+    Args:
+        v: Field value to validate
+        field_name: Name of the field for error messages
+        expect_kanji: Whether the value must be a single kanji character
+
+    Returns:
+        The normalized value
+
+    Raises:
+        ValueError: If the value contains control characters, or is not a
+            kanji when expect_kanji is True
+    """
+    _validate_no_control_chars(v, field_name)
+    v = _normalize_japanese_text(v)
+
+    if expect_kanji and not _is_kanji_character(v):
+        raise ValueError(
+            f"Invalid kanji character '{v}'. "
+            f"Must be a CJK ideograph (e.g., 親, 見, 日). "
+            f"Hiragana, katakana, romaji, and other characters are not accepted."
+        )
 
+    return v
 
 
 class KanjiBasicSearchInput(BaseModel):
     """Input model for basic kanji search."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid',
         json_schema_serialization_defaults_required=True
     )
@@ -349,32 +562,32 @@ class KanjiBasicSearchInput(BaseModel):
     @classmethod
     def validate_and_normalize_query(cls, v: str) -> str:
         """Validate and normalize query string."""
-        v = v.strip()
-        # Reject control characters (null bytes, etc.) before processing
-        _validate_no_control_chars(v, "query")
-        return _normalize_japanese_text(v)
+        return _validate_kanji_or_text(v, "query")
 
 
 class KanjiAdvancedSearchInput(BaseModel):
     """Input model for advanced kanji search with multiple filter parameters."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid',
         json_schema_serialization_defaults_required=True
     )
 
     on: Optional[str] = Field(
         default=None,
-        description="Onyomi (on) reading in romaji or katakana (shin, シン)"
+        description="Onyomi (on) reading in romaji or katakana (shin, シン)",
+        max_length=100
     )
     kun: Optional[str] = Field(
         default=None,
-        description="Kunyomi (kun) reading in romaji or hiragana (oya, おや)"
+        description="Kunyomi (kun) reading in romaji or hiragana (oya, おや)",
+        max_length=100
     )
     kem: Optional[str] = Field(
         default=None,
-        description="Kanji English meaning (parent, see)"
+        description="Kanji English meaning (parent, see)",
+        max_length=100
     )
     ks: Optional[int] = Field(
         default=None,
@@ -390,11 +603,13 @@ class KanjiAdvancedSearchInput(BaseModel):
     )
     rjn: Optional[str] = Field(
         default=None,
-        description="Radical Japanese name in romaji or hiragana (miru, みる)"
+        description="Radical Japanese name in romaji or hiragana (miru, みる)",
+        max_length=100
     )
     rem: Optional[str] = Field(
         default=None,
-        description="Radical English meaning (see, fire, water)"
+        description="Radical English meaning (see, fire, water)",
+        max_length=100
     )
     rs: Optional[int] = Field(
         default=None,
@@ -404,7 +619,8 @@ class KanjiAdvancedSearchInput(BaseModel):
     )
     rpos: Optional[str] = Field(
         default=None,
-        description="Radical position: hen, tsukuri, kanmuri, ashi, kamae, tare, nyou, or in hiragana"
+        description="Radical position: hen, tsukuri, kanmuri, ashi, kamae, tare, nyou, or in hiragana",
+        max_length=100
     )
     grade: Optional[int] = Field(
         default=None,
@@ -418,7 +634,8 @@ class KanjiAdvancedSearchInput(BaseModel):
             "Study list to search within. "
             "Values: 'ap' (Advanced Placement Exam), 'mac' (Macquarie University). "
             "Can include chapter: 'ap:c3' for AP chapter 3, 'mac:c12' for Macquarie chapter 12."
-        )
+        ),
+        max_length=100
     )
 
     @field_validator('list')
@@ -428,7 +645,7 @@ class KanjiAdvancedSearchInput(BaseModel):
         if v is None:
             return v
 
-        v = v.strip().lower()
+        v = v.lower()
 
         # Valid base lists
         valid_lists = {'ap', 'mac'}
@@ -448,7 +665,7 @@ class KanjiAdvancedSearchInput(BaseModel):
                     f"Valid lists: 'ap' (Advanced Placement), 'mac' (Macquarie)."
                 )
             # Validate chapter format (should be 'c' followed by number)
-            if not re.match(r'^c\d+$', chapter):
+            if not _CHAPTER_RE.match(chapter):
                 raise ValueError(
                     f"Invalid chapter format '{chapter}'. "
                     f"Use format 'c1', 'c2', 'c12', etc."
@@ -468,27 +685,12 @@ class KanjiAdvancedSearchInput(BaseModel):
         """Validate Onyomi reading format (romaji or katakana only)."""
         if v is None:
             return v
-
-        # Normalize Unicode before validation
-        v = _normalize_japanese_text(v.strip())
-
-        # Pattern for pure katakana (including middle dot, iteration marks)
-        katakana_pattern = r'^[\u30A0-\u30FF\u30FB-\u30FE・]+$'
-        # Pattern for pure romaji (ASCII letters, hyphens for compounds)
-        romaji_pattern = r'^[a-zA-Z\-]+$'
-
-        is_katakana = re.match(katakana_pattern, v)
-        is_romaji = re.match(romaji_pattern, v)
-
-        if not (is_katakana or is_romaji):
-            raise ValueError(
-                f"Invalid Onyomi reading '{v}'. "
-                f"Must be either romaji (e.g., 'shin') or katakana (e.g., 'シン'). "
-                f"Do not mix scripts or use hiragana for Onyomi."
-            )
-
-        # Normalize romaji to lowercase for consistency
-        return v.lower() if is_romaji else v
+        return _validate_reading(
+            v, _ONYOMI_ROMAJI_CHARS, _ONYOMI_KATAKANA_RE,
+            "Invalid Onyomi reading '{reading}'. "
+            "Must be either romaji (e.g., 'shin') or katakana (e.g., 'シン'). "
+            "Do not mix scripts or use hiragana for Onyomi."
+        )
 
     @field_validator('kun', 'rjn')
     @classmethod
@@ -496,27 +698,12 @@ class KanjiAdvancedSearchInput(BaseModel):
         """Validate Kunyomi/radical name format (romaji or hiragana only)."""
         if v is None:
             return v
-
-        # Normalize Unicode before validation
-        v = _normalize_japanese_text(v.strip())
-
-        # Pattern for pure hiragana (including iteration marks, small kana, dots for okurigana)
-        hiragana_pattern = r'^[\u3040-\u309F\u3099-\u309C.・]+$'
-        # Pattern for pure romaji (ASCII letters, dots for okurigana, hyphens)
-        romaji_pattern = r'^[a-zA-Z.\-]+$'
-
-        is_hiragana = re.match(hiragana_pattern, v)
-        is_romaji = re.match(romaji_pattern, v)
-
-        if not (is_hiragana or is_romaji):
-            raise ValueError(
-                f"Invalid reading '{v}'. "
-                f"Must be either romaji (e.g., 'oya') or hiragana (e.g., 'おや'). "
-                f"Do not mix scripts or use katakana."
-            )
-
-        # Normalize romaji to lowercase
-        return v.lower() if is_romaji else v
+        return _validate_reading(
+            v, _KUN_ROMAJI_CHARS, _KUN_HIRAGANA_RE,
+            "Invalid reading '{reading}'. "
+            "Must be either romaji (e.g., 'oya') or hiragana (e.g., 'おや'). "
+            "Do not mix scripts or use katakana."
+        )
 
     @field_validator('rpos')
     @classmethod
@@ -525,23 +712,16 @@ class KanjiAdvancedSearchInput(BaseModel):
         if v is None:
             return v
 
-        v_lower = v.strip().lower()
-
-        if v_lower not in VALID_RADICAL_POSITIONS:
+        canonical = _RPOS_LOOKUP.get(v.lower())
+        if canonical is None:
             raise ValueError(
                 f"Invalid radical position '{v}'. "
                 f"Valid romaji: hen, tsukuri, kanmuri, ashi, kamae, tare, nyou. "
                 f"Valid hiragana: へん, つくり, かんむり, あし, かまえ, たれ, にょう"
             )
 
-        # Normalize hiragana to romaji for API consistency
-        return RPOS_NORMALIZE.get(v_lower, v_lower)
-
-    @field_validator('kem', 'rem')
-    @classmethod
-    def strip_whitespace(cls, v: Optional[str]) -> Optional[str]:
-        """Strip whitespace from English meaning fields."""
-        return v.strip() if v else v
+        # Hiragana positions map to romaji for API consistency
+        return canonical
 
     @field_validator('kanji')
     @classmethod
@@ -549,30 +729,14 @@ class KanjiAdvancedSearchInput(BaseModel):
         """Validate that the kanji field contains a valid kanji character."""
         if v is None:
             return v
-
-        v = _normalize_japanese_text(v.strip())
-
-        if not _is_kanji_character(v):
-            raise ValueError(
-                f"Invalid kanji character '{v}'. "
-                f"Must be a CJK ideograph (e.g., 親, 見, 日). "
-                f"Hiragana, katakana, romaji, and other characters are not accepted."
-            )
-
-        return v
-
-    def has_any_filter(self) -> bool:
-        """Check if any search filter is provided."""
-        fields = [self.on, self.kun, self.kem, self.ks, self.kanji,
-                  self.rjn, self.rem, self.rs, self.rpos, self.grade, self.list]
-        return any(f is not None for f in fields)
+        return _validate_kanji_or_text(v, "kanji", expect_kanji=True)
 
 
 class KanjiDetailInput(BaseModel):
     """Input model for retrieving detailed information about a specific kanji."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid',
         json_schema_serialization_defaults_required=True
     )
@@ -588,16 +752,36 @@ class KanjiDetailInput(BaseModel):
     @classmethod
     def validate_and_normalize_character(cls, v: str) -> str:
         """Validate and normalize kanji character."""
-        v = _normalize_japanese_text(v.strip())
+        return _validate_kanji_or_text(v, "character", expect_kanji=True)
 
-        if not _is_kanji_character(v):
-            raise ValueError(
-                f"Invalid kanji character '{v}'. "
-                f"Must be a CJK ideograph (e.g., 親, 見, 日). "
-                f"Hiragana, katakana, romaji, and other characters are not accepted."
-            )
 
-        return v
+class KanjiDetailBatchInput(BaseModel):
+    """Input model for retrieving details about several kanji in one call."""
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        frozen=True,
+        extra='forbid',
+        json_schema_serialization_defaults_required=True
+    )
+
+    characters: List[Annotated[str, Field(min_length=1, max_length=1)]] = Field(
+        ...,
+        description=(
+            "The kanji characters to look up, one per item (['親', '見', '日']). "
+            f"Up to {MAX_BATCH_CHARACTERS} characters per call."
+        ),
+        min_length=1,
+        max_length=MAX_BATCH_CHARACTERS
+    )
+
+    @field_validator('characters')
+    @classmethod
+    def validate_and_normalize_characters(cls, v: List[str]) -> List[str]:
+        """Validate and normalize each kanji character."""
+        return [
+            _validate_kanji_or_text(c, f"characters[{i}]", expect_kanji=True)
+            for i, c in enumerate(v)
+        ]
 
 
 class SearchResultMetadata(BaseModel):
@@ -639,29 +823,329 @@ class KanjiDetailOutput(BaseModel):
 
 
 
-def _jittered_delay(backoff: float, max_backoff: float) -> float:
+class KanjiDetailBatchItem(BaseModel):
+    """Result of one lookup within a batch kanji detail request."""
+    character: str = Field(description="The kanji character that was looked up")
+    kanji: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Complete kanji data, or null if the lookup failed"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Error message if the lookup failed, otherwise null"
+    )
+
+
+class KanjiDetailBatchMetadata(BaseModel):
+    """Metadata for a batch kanji detail response."""
+    timestamp: str = Field(description="ISO format timestamp of request")
+    characters_requested: int = Field(description="Number of characters requested")
+    characters_found: int = Field(description="Number of characters returned without error")
+
+
+class KanjiDetailBatchOutput(BaseModel):
+    """Structured output for the batch kanji detail tool."""
+    metadata: KanjiDetailBatchMetadata = Field(description="Request metadata")
+    results: List[KanjiDetailBatchItem] = Field(
+        description="One entry per requested character, in request order"
+    )
+
+
+class RequestInfo(NamedTuple):
+    """Metadata about an API request, returned alongside its response data."""
+    endpoint: str
+    params: Mapping[str, Any]
+    timestamp: str
+
+
+# Last formatted request timestamp, reused for every request within the same second
+_LAST_TIMESTAMP_SECOND: int = -1
+_LAST_TIMESTAMP: str = ""
+
+
+def _current_timestamp() -> str:
     """
-    Calculate a delay with 0-10% jitter, capped at max_backoff.
+    Get the current UTC time as an ISO format string with second precision.
+
+    UTC avoids a local timezone conversion and gives clients an unambiguous
+    offset. The formatted string is memoized per second so that bursts of
+    requests do not each allocate and format a new datetime.
+
+    Returns:
+        ISO format timestamp (e.g., 2024-01-31T12:34:56+00:00)
+    """
+    global _LAST_TIMESTAMP_SECOND, _LAST_TIMESTAMP
+
+    second = int(time.time())
+    if second != _LAST_TIMESTAMP_SECOND:
+        _LAST_TIMESTAMP = datetime.datetime.fromtimestamp(second, datetime.timezone.utc).isoformat()
+        _LAST_TIMESTAMP_SECOND = second
+    return _LAST_TIMESTAMP
+
+
+# Dedicated generator for retry jitter (avoids the shared module-level instance)
+_RNG = random.Random()
+
+
+# Base delay before each retry: exponential from 0.5s, capped at MAX_BACKOFF
+_BACKOFF_SCHEDULE: Tuple[float, ...] = tuple(
+    min(0.5 * 2 ** i, MAX_BACKOFF) for i in range(MAX_RETRIES - 1)
+)
+
+
+def _jittered_delay(attempt: int) -> float:
+    """
+    Calculate the delay before retrying a failed attempt, with full jitter.
+
+    The delay is drawn uniformly from [0, base) so that callers which
+    failed together do not retry in lockstep.
 
     Args:
-        backoff: Current backoff value in seconds
-        max_backoff: Maximum allowed delay in seconds
+        attempt: 1-based number of the attempt that just failed
 
     Returns:
-        Delay in seconds
+        Delay in seconds, capped at MAX_BACKOFF
     """
-    base = min(backoff, max_backoff)
-    jitter = random.uniform(0, base * 0.1)
-    return min(base + jitter, max_backoff)
+    return _RNG.random() * _BACKOFF_SCHEDULE[attempt - 1]
+
+
+def _quote_path_segment(text: str) -> str:
+    """
+    Percent-encode text for use as a single URL path segment.
+
+    ASCII letters and digits never need encoding, so English meanings and
+    romaji readings are returned as-is. Other text is encoded as UTF-8 and
+    passed straight to quote_from_bytes(), skipping quote()'s type checks.
+
+    Args:
+        text: Text to encode
+
+    Returns:
+        Text safe to embed in a URL path segment
+    """
+    if text.isascii() and text.isalnum():
+        return text
+    return quote_from_bytes(text.encode('utf-8'), safe='')
+
+
+def _sorted_query_items(params: Optional[Dict[str, Any]] = None) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Build the sorted query parameter items for an API request.
+
+    The same tuple serves as part of the response cache key and as the
+    source of the encoded query string, so it is built once per request.
+
+    Args:
+        params: Optional query parameters
+
+    Returns:
+        Tuple of (name, value) pairs sorted by name, omitting None values
+    """
+    if not params:
+        return ()
+    return tuple(sorted((k, v) for k, v in params.items() if v is not None))
+
+
+def _lru_get(cache: "OrderedDict[Any, Any]", key: Any) -> Any:
+    """
+    Look up a key in an LRU cache and mark it as most recently used.
+
+    Entries older than CACHE_TTL are evicted and reported as a miss.
+
+    Args:
+        cache: OrderedDict used as an LRU cache
+        key: Cache key
+
+    Returns:
+        The cached value, or None on a cache miss
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: "OrderedDict[Any, Any]", key: Any, value: Any, max_size: int) -> None:
+    """
+    Store a value in an LRU cache, evicting the least recently used entry when full.
+
+    The entry expires CACHE_TTL seconds from now.
+
+    Args:
+        cache: OrderedDict used as an LRU cache
+        key: Cache key
+        value: Value to cache
+        max_size: Maximum number of entries to keep
+    """
+    cache[key] = (time.monotonic() + CACHE_TTL, value)
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def _get_cached_response(key: Tuple[Any, ...]) -> Optional[Tuple[Any, RequestInfo]]:
+    """
+    Look up a cached API response and mark it as most recently used.
+
+    Args:
+        key: Cache key of (endpoint, sorted query items)
+
+    Returns:
+        A (response_data, request_info) tuple with a deep copy of the
+        cached response data and the current timestamp, or None on a
+        cache miss
+    """
+    cached = _lru_get(_RESPONSE_CACHE, key)
+    if cached is None:
+        return None
+    response_data, request_info = cached
+    # Callers may mutate the response data, so never hand out the cached
+    # objects. Timestamp the hit itself, as the kanji detail cache does,
+    # rather than reporting when the response was first fetched.
+    return (
+        copy.deepcopy(response_data),
+        request_info._replace(timestamp=_current_timestamp())
+    )
+
+
+def _store_cached_response(
+    key: Tuple[Any, ...],
+    response: Tuple[Any, RequestInfo]
+) -> None:
+    """
+    Store an API response, evicting the least recently used entry when full.
+
+    The response is stored as given, so the caller must pass data that is
+    not handed out anywhere else (see _make_api_request()).
+
+    Args:
+        key: Cache key of (endpoint, sorted query items)
+        response: (response_data, request_info) tuple to cache
+    """
+    _lru_put(_RESPONSE_CACHE, key, response, RESPONSE_CACHE_SIZE)
+
+
+class _InflightRequest:
+    """
+    An upstream request in progress, shared by concurrent identical callers.
+
+    The future resolves to the (response_data, request_info) tuple or to
+    the request's exception. waiters counts the callers awaiting it, so
+    the response is only copied for sharing when someone will read it.
+    """
+    __slots__ = ('future', 'waiters')
+
+    def __init__(self, future: "asyncio.Future[Tuple[Any, RequestInfo]]"):
+        self.future = future
+        self.waiters = 0
 
 
 async def _make_api_request(
     client: httpx.AsyncClient,
     endpoint: str,
-    params: Optional[Dict[str, Any]] = None
-) -> Tuple[Any, Dict[str, Any]]:
+    params: Optional[Dict[str, Any]] = None,
+    cache_response: bool = True
+) -> Tuple[Any, RequestInfo]:
+    """
+    Make an API request to Kanji Alive, serving repeated requests from cache.
+
+    Successful responses are kept in an in-memory LRU cache for up to
+    CACHE_TTL seconds. Concurrent identical requests are coalesced so only
+    one of them reaches the API; the others await the same in-flight
+    future and receive its result or its exception.
+
+    Args:
+        client: HTTP client from lifespan context
+        endpoint: API endpoint path
+        params: Optional query parameters
+        cache_response: Whether to read and fill the response cache.
+            Concurrent identical requests are coalesced either way.
+
+    Returns:
+        Tuple of (response_data, request_info), see _fetch_api_response().
+        response_data is always a list for search endpoints and a
+        non-empty dict for kanji endpoints (see _validate_api_response())
+
+    Raises:
+        httpx.HTTPStatusError: If the API returns an error status code
+        httpx.TimeoutException: If the request times out
+    """
+    query_items = _sorted_query_items(params)
+    key = (endpoint, query_items)
+
+    while True:
+        if cache_response:
+            cached = _get_cached_response(key)
+            if cached is not None:
+                _CACHE_STATS["response_hits"] += 1
+                logger.debug(f"Response cache hit for {endpoint}")
+                return cached
+
+        inflight = _INFLIGHT_REQUESTS.get(key)
+        if inflight is None:
+            break
+        future = inflight.future
+        inflight.waiters += 1
+        try:
+            # Shield the shared future so a cancelled waiter does not cancel
+            # the request for everyone else
+            response_data, request_info = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # The request that owned the future was cancelled; try again
+                continue
+            raise
+        if cache_response:
+            _CACHE_STATS["response_hits"] += 1
+        return copy.deepcopy(response_data), request_info
+
+    inflight = _InflightRequest(asyncio.get_running_loop().create_future())
+    future = inflight.future
+    _INFLIGHT_REQUESTS[key] = inflight
+    if cache_response:
+        _CACHE_STATS["response_misses"] += 1
+    try:
+        response_data, request_info = await _fetch_api_response(
+            client, endpoint, params, query_items
+        )
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception as retrieved in case nothing else was waiting
+        future.exception()
+        raise
+    else:
+        if cache_response or inflight.waiters:
+            # One private copy serves both the cache and the waiters, which
+            # copy it again; the caller keeps the original and may mutate it
+            shared = (copy.deepcopy(response_data), request_info)
+            if cache_response:
+                _store_cached_response(key, shared)
+            future.set_result(shared)
+        else:
+            # Nobody else will read the result
+            future.set_result((None, request_info))
+        return response_data, request_info
+    finally:
+        if _INFLIGHT_REQUESTS.get(key) is inflight:
+            del _INFLIGHT_REQUESTS[key]
+
+
+async def _fetch_api_response(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    query_items: Optional[Tuple[Tuple[str, Any], ...]] = None
+) -> Tuple[Any, RequestInfo]:
     """
-    Make an API request to Kanji Alive via RapidAPI.
+    Make an API request to Kanji Alive via RapidAPI, retrying transient failures.
 
     This function returns BOTH the API response AND metadata about the request.
 
@@ -669,42 +1153,46 @@ async def _make_api_request(
         client: HTTP client from lifespan context
         endpoint: API endpoint path
         params: Optional query parameters
+        query_items: Pre-sorted query items from _sorted_query_items();
+            computed from params when not given
 
     Returns:
         Tuple of (response_data, request_info) where:
         - response_data: JSON response from the API
-        - request_info: Dict containing {endpoint, params, timestamp}
+        - request_info: RequestInfo with endpoint, params and timestamp
 
     Raises:
         httpx.HTTPStatusError: If the API returns an error status code
         httpx.TimeoutException: If the request times out
     """
-    url = f"{API_BASE_URL}/{endpoint}"
+    if query_items is None:
+        query_items = _sorted_query_items(params)
 
-    max_retries = 3
-    backoff = 0.5  # Initial backoff in seconds
-    max_backoff = 30.0  # Maximum backoff cap in seconds
+    # Encode the query string once here rather than via httpx params on every attempt
+    url = f"{API_BASE_URL}/{endpoint}"
+    if query_items:
+        url = f"{url}?{urlencode(query_items, quote_via=quote)}"
 
     last_exception = None
 
-    for attempt in range(1, max_retries + 1):
+    for attempt in range(1, MAX_RETRIES + 1):
         try:
-            response = await client.get(url, params=params)
+            response = await client.get(url)
             response.raise_for_status()
 
-            response_data = response.json()
+            response_data = _json_loads(response.content)
 
             try:
-                _validate_search_response(response_data, endpoint)
+                _validate_api_response(response_data, endpoint)
             except ValueError as ve:
                 logger.error(f"Response validation failed: {ve}")
                 raise
 
-            request_info = {
-                "endpoint": endpoint,
-                "params": dict(params) if params else {},
-                "timestamp": datetime.datetime.now().isoformat()
-            }
+            request_info = RequestInfo(
+                endpoint=endpoint,
+                params=MappingProxyType(dict(params)) if params else _EMPTY_MAPPING,
+                timestamp=_current_timestamp()
+            )
 
             return response_data, request_info
 
@@ -712,65 +1200,67 @@ async def _make_api_request(
             status = e.response.status_code
             if status == 429 or 500 <= status < 600:
                 last_exception = e
-                if attempt < max_retries:
-                    # Honor Retry-After header for 429 rate limiting
-                    if status == 429:
-                        retry_after = e.response.headers.get("Retry-After")
-                        if retry_after and retry_after.isdigit():
-                            delay = min(float(retry_after), max_backoff)
-                            logger.warning(
-                                f"Rate limited (429). Retry-After: {retry_after}s, "
-                                f"waiting {delay}s (attempt {attempt}/{max_retries})"
-                            )
-                        else:
-                            delay = _jittered_delay(backoff, max_backoff)
-                            logger.warning(
-                                f"Rate limited (429), no Retry-After header. "
-                                f"Backoff: {delay:.2f}s (attempt {attempt}/{max_retries})"
-                            )
+                if attempt < MAX_RETRIES:
+                    # Honor Retry-After header for 429 rate limiting and 503
+                    retry_after = e.response.headers.get("Retry-After")
+                    if status in (429, 503) and retry_after and retry_after.isdigit():
+                        delay = min(float(retry_after), MAX_BACKOFF)
+                        logger.warning(
+                            f"Status {status}. Retry-After: {retry_after}s, "
+                            f"waiting {delay}s (attempt {attempt}/{MAX_RETRIES})"
+                        )
+                    elif status == 429:
+                        delay = _jittered_delay(attempt)
+                        logger.warning(
+                            f"Rate limited (429), no Retry-After header. "
+                            f"Backoff: {delay:.2f}s (attempt {attempt}/{MAX_RETRIES})"
+                        )
                     else:
-                        delay = _jittered_delay(backoff, max_backoff)
+                        delay = _jittered_delay(attempt)
                         logger.warning(
                             f"Server error {status}, "
-                            f"retrying in {delay:.2f}s (attempt {attempt}/{max_retries})"
+                            f"retrying in {delay:.2f}s (attempt {attempt}/{MAX_RETRIES})"
                         )
 
                     await asyncio.sleep(delay)
-                    backoff = min(backoff * 2, max_backoff)
                     continue
             raise
 
         except (httpx.RequestError, httpx.TimeoutException) as e:
             last_exception = e
-            if attempt < max_retries:
-                delay = _jittered_delay(backoff, max_backoff)
+            if attempt < MAX_RETRIES:
+                delay = _jittered_delay(attempt)
                 logger.warning(
                     f"Network error: {type(e).__name__}, "
-                    f"retrying in {delay:.2f}s (attempt {attempt}/{max_retries})"
+                    f"retrying in {delay:.2f}s (attempt {attempt}/{MAX_RETRIES})"
                 )
                 await asyncio.sleep(delay)
-                backoff = min(backoff * 2, max_backoff)
                 continue
             raise
 
     if last_exception:
         raise last_exception
     raise httpx.HTTPError(
-        f"Request failed after {max_retries} retries. "
+        f"Request failed after {MAX_RETRIES} retries. "
         f"URL: {url}, params: {params}"
     )
 
 
-def _validate_search_response(data: Any, endpoint: str) -> None:
+def _validate_api_response(data: Any, endpoint: str) -> None:
     """
-    Validate API response structure for search endpoints.
+    Validate API response structure and emptiness in a single dispatch.
+
+    Search endpoints must return a list (an empty list is a valid "no
+    results" answer); kanji detail endpoints must return a non-empty
+    dictionary.
 
     Args:
         data: Response data from API
         endpoint: The endpoint that was called
 
     Raises:
-        ValueError: If response structure is invalid
+        ValueError: If response structure is invalid, or a kanji detail
+            response is empty
     """
     if endpoint.startswith("search"):
         if not isinstance(data, list):
@@ -783,6 +1273,16 @@ def _validate_search_response(data: Any, endpoint: str) -> None:
                 f"Expected list of results, got {type(data).__name__}"
             )
 
+        if not data:
+            # Don't raise - empty results are valid for searches
+            logger.info(f"Empty result set for endpoint: {endpoint}")
+            return
+
+        # Fast path: a single all() pass covers the common well-formed response;
+        # only walk the results individually to report what is wrong
+        if all(isinstance(item, dict) and 'kanji' in item for item in data):
+            return
+
         # Validate each result has required fields
         for idx, item in enumerate(data):
             if not isinstance(item, dict):
@@ -806,6 +1306,13 @@ def _validate_search_response(data: Any, endpoint: str) -> None:
                 f"Expected dictionary, got {type(data).__name__}"
             )
 
+        if not data:
+            character = endpoint.partition('/')[2]
+            raise ValueError(
+                f"API returned empty response for kanji '{character}'. "
+                f"The kanji may not exist in the database."
+            )
+
         # Check for required top-level fields
         required_fields = ['kanji']
         missing = [f for f in required_fields if f not in data]
@@ -816,32 +1323,6 @@ def _validate_search_response(data: Any, endpoint: str) -> None:
             )
 
 
-def _validate_response_not_empty(data: Any, query_info: str) -> None:
-    """
-    Validate that response data is not empty.
-
-    Args:
-        data: Response data from API
-        query_info: Description of the query for error messages
-
-    Raises:
-        ValueError: If response is empty when it shouldn't be
-    """
-    if isinstance(data, list) and len(data) == 0:
-        logger.info(f"Empty result set for query: {query_info}")
-        # Don't raise - empty results are valid for searches
-    elif isinstance(data, dict) and not data:
-        raise ValueError(
-            f"API returned empty response for {query_info}. "
-            f"The kanji may not exist in the database."
-        )
-    elif data is None:
-        raise ValueError(
-            f"API returned null response for {query_info}. "
-            f"This may indicate a server error."
-        )
-
-
 def _handle_api_error(e: Exception) -> None:
     """
     Handle API errors by raising ToolError with formatted message.
@@ -890,7 +1371,8 @@ def _handle_api_error(e: Exception) -> None:
     # Log full details for debugging
     logger.error(
         f"Unexpected error in API request: {type(e).__name__}",
-        exc_info=True,
+        # Pass the exception itself: the batch tool calls this outside an except block
+        exc_info=e,
         extra={
             "error_type": type(e).__name__,
             "error_message": str(e)
@@ -924,171 +1406,240 @@ def _format_search_results_markdown(
     if not results:
         return "No kanji found matching your search criteria."
 
-    output = "# Kanji Search Results\n\n"
+    parts = ["# Kanji Search Results\n\n"]
 
     if metadata:
-        output += metadata.to_markdown_header()
+        parts.append(metadata.to_markdown_header())
     else:
-        output += (
+        parts.append(
             f"## Result Information\n\n"
             f"- **Results Found:** {len(results)}\n\n"
         )
 
     # Search API returns minimal data: character, stroke count, and radical info
-    output += "| Kanji | Strokes | Radical | Rad. Strokes | Rad. # |\n"
-    output += "|-------|---------|---------|--------------|--------|\n"
+    parts.append("| Kanji | Strokes | Radical | Rad. Strokes | Rad. # |\n")
+    parts.append("|-------|---------|---------|--------------|--------|\n")
 
     for kanji in results:
-        char = kanji.get('kanji', {}).get('character', '?')
+        k_info = kanji.get('kanji', _EMPTY_MAPPING)
+        char = k_info.get('character', '?')
         # Search API uses 'stroke' (singular) as direct integer
-        strokes = kanji.get('kanji', {}).get('stroke', 'N/A')
+        strokes = k_info.get('stroke', 'N/A')
 
-        radical = kanji.get('radical', {})
+        radical = kanji.get('radical', _EMPTY_MAPPING)
         radical_char = radical.get('character', 'N/A')
         radical_strokes = radical.get('stroke', 'N/A')
         radical_order = radical.get('order', 'N/A')
 
-        output += f"| {char} | {strokes} | {radical_char} | {radical_strokes} | {radical_order} |\n"
+        parts.append(f"| {char} | {strokes} | {radical_char} | {radical_strokes} | {radical_order} |\n")
 
-    output += f"\n**Total Results Shown:** {len(results)}\n"
+    parts.append(f"\n**Total Results Shown:** {len(results)}\n")
 
-    return output
+    return "".join(parts)
 
 
-def _format_kanji_detail_markdown(kanji: Dict[str, Any]) -> str:
+def _format_reading_list(
+    heading: str,
+    kana: str,
+    romaji: str,
+    kana_split_re: "re.Pattern[str]" = _READING_SPLIT_RE
+) -> str:
     """
-    Format detailed kanji information in markdown.
+    Format one reading type as a bulleted list pairing kana with romaji.
 
     Args:
-        kanji: Kanji object from the API
+        heading: Bold label for the list (e.g. "Onyomi (音読み)")
+        kana: Comma-separated kana readings from the API
+        romaji: Comma-separated romaji readings in the same order
+        kana_split_re: Separator pattern for the kana readings
 
     Returns:
-        Markdown-formatted string with comprehensive kanji details
+        Markdown section, or an empty string if there are no kana readings
+    """
+    if not kana:
+        return ""
+    kana_parts = _split_readings(kana, kana_split_re)
+    roma_parts = _split_readings(romaji)
+    lines = [f"**{heading}:**\n"]
+    # Zip with fallback for mismatched lengths
+    for i, reading in enumerate(kana_parts):
+        roma = roma_parts[i] if i < len(roma_parts) else ''
+        lines.append(f"- {reading} ({roma})\n" if roma else f"- {reading}\n")
+    lines.append("\n")
+    return "".join(lines)
+
+
+def _format_detail_basic(k_info: Mapping[str, Any], refs: Mapping[str, Any]) -> str:
+    """
+    Format the title, meaning and basic information section of a kanji.
+
+    Args:
+        k_info: The 'kanji' object of a detail response
+        refs: The 'references' object of a detail response
+
+    Returns:
+        Markdown section string
     """
-    char = kanji.get('kanji', {}).get('character', '?')
-    k_info = kanji.get('kanji', {})
-    meaning = k_info.get('meaning', {}).get('english', 'N/A')
+    char = k_info.get('character', '?')
+    meaning = k_info.get('meaning', _EMPTY_MAPPING).get('english', 'N/A')
     # Detail API strokes: object {count, timings, images} or integer (after filtering)
     strokes_raw = k_info.get('strokes')
     if isinstance(strokes_raw, dict):
         strokes = strokes_raw.get('count', 'N/A')
     else:
         strokes = strokes_raw if strokes_raw is not None else 'N/A'
-    refs = kanji.get('references', {})
     grade = refs.get('grade', None)
 
-    output = f"# {char} - Kanji Details\n\n"
-    output += f"**Meaning:** {_escape_markdown(meaning)}\n\n"
+    # Stroke order video (mp4)
+    video_mp4 = k_info.get('video', _EMPTY_MAPPING).get('mp4', '')
+    video_line = f"- **Stroke Order Video:** <{video_mp4}>\n" if video_mp4 else ""
+
+    return (
+        f"# {char} - Kanji Details\n\n"
+        f"**Meaning:** {_escape_markdown(meaning)}\n\n"
+        f"## Basic Information\n\n"
+        f"- **Strokes:** {strokes}\n"
+        f"- **Grade:** {grade if grade else 'Not taught in elementary school'}\n"
+        f"{video_line}\n"
+    )
 
-    # Basic info
-    output += "## Basic Information\n\n"
-    output += f"- **Strokes:** {strokes}\n"
-    output += f"- **Grade:** {grade if grade else 'Not taught in elementary school'}\n"
 
-    # Stroke order video (mp4)
-    video = k_info.get('video', {})
-    video_mp4 = video.get('mp4', '')
-    if video_mp4:
-        output += f"- **Stroke Order Video:** <{video_mp4}>\n"
-    output += "\n"
-
-    # Readings - API returns comma-separated strings, not arrays
-    output += "## Readings\n\n"
-
-    onyomi = k_info.get('onyomi', {})
-    if onyomi:
-        # API returns strings like "ホウ" or "otozureru, tazuneru"
-        onyomi_kata = onyomi.get('katakana', '')
-        onyomi_roma = onyomi.get('romaji', '')
-        if onyomi_kata:
-            output += "**Onyomi (音読み):**\n"
-            # Split comma-separated readings and pair them
-            kata_parts = [k.strip() for k in onyomi_kata.split(',') if k.strip()]
-            roma_parts = [r.strip() for r in onyomi_roma.split(',') if r.strip()]
-            # Zip with fallback for mismatched lengths
-            for i, kata in enumerate(kata_parts):
-                roma = roma_parts[i] if i < len(roma_parts) else ''
-                if roma:
-                    output += f"- {kata} ({roma})\n"
-                else:
-                    output += f"- {kata}\n"
-            output += "\n"
-
-    kunyomi = k_info.get('kunyomi', {})
-    if kunyomi:
-        # API returns strings with Japanese comma (、) separation
-        kunyomi_hira = kunyomi.get('hiragana', '')
-        kunyomi_roma = kunyomi.get('romaji', '')
-        if kunyomi_hira:
-            output += "**Kunyomi (訓読み):**\n"
-            # Split on Japanese comma (、) or regular comma
-            hira_parts = [h.strip() for h in kunyomi_hira.replace('、', ',').split(',') if h.strip()]
-            roma_parts = [r.strip() for r in kunyomi_roma.split(',') if r.strip()]
-            for i, hira in enumerate(hira_parts):
-                roma = roma_parts[i] if i < len(roma_parts) else ''
-                if roma:
-                    output += f"- {hira} ({roma})\n"
-                else:
-                    output += f"- {hira}\n"
-            output += "\n"
-
-    # Radical
-    radical = kanji.get('radical', {})
-    if radical:
-        output += "## Radical\n\n"
-        rad_char = radical.get('character', 'N/A')
-        rad_meaning = radical.get('meaning', {}).get('english', 'N/A')
-        rad_strokes = radical.get('strokes', 'N/A')
-        rad_name_hira = radical.get('name', {}).get('hiragana', 'N/A')
-        rad_name_roma = radical.get('name', {}).get('romaji', 'N/A')
-        rad_position = radical.get('position', {}).get('hiragana', '')
-
-        output += f"- **Character:** {rad_char}\n"
-        output += f"- **Meaning:** {_escape_markdown(rad_meaning)}\n"
-        output += f"- **Name:** {rad_name_hira} ({_escape_markdown(rad_name_roma)})\n"
-        output += f"- **Strokes:** {rad_strokes}\n"
-        if rad_position:
-            output += f"- **Position:** {rad_position}\n"
-        output += "\n"
-
-    # Dictionary references (refs already fetched above for grade)
-    if refs:
-        output += "## Dictionary References\n\n"
-        if refs.get('kodansha'):
-            output += f"- **Kodansha:** {refs['kodansha']}\n"
-        if refs.get('classic_nelson'):
-            output += f"- **Classic Nelson:** {refs['classic_nelson']}\n"
-        output += "\n"
-
-    # Examples - limit to prevent overwhelming responses
-    MAX_EXAMPLES = 15
-    examples = kanji.get('examples', [])
-    if examples:
-        total_examples = len(examples)
-        display_examples = examples[:MAX_EXAMPLES]
-
-        if total_examples > MAX_EXAMPLES:
-            output += f"## Example Words (showing {MAX_EXAMPLES} of {total_examples})\n\n"
-        else:
-            output += "## Example Words\n\n"
+def _format_detail_readings(k_info: Mapping[str, Any]) -> str:
+    """
+    Format the onyomi and kunyomi readings section of a kanji.
+
+    The API returns readings as comma-separated strings, not arrays
+    (e.g. "ホウ" or "otozureru, tazuneru"); kunyomi kana use the
+    Japanese comma (、).
+
+    Args:
+        k_info: The 'kanji' object of a detail response
+
+    Returns:
+        Markdown section string
+    """
+    onyomi = k_info.get('onyomi', _EMPTY_MAPPING)
+    kunyomi = k_info.get('kunyomi', _EMPTY_MAPPING)
+    return "".join((
+        "## Readings\n\n",
+        _format_reading_list("Onyomi (音読み)", onyomi.get('katakana', ''), onyomi.get('romaji', '')),
+        _format_reading_list(
+            "Kunyomi (訓読み)", kunyomi.get('hiragana', ''), kunyomi.get('romaji', ''),
+            _KUNYOMI_KANA_SPLIT_RE
+        ),
+    ))
+
+
+def _format_detail_radical(radical: Mapping[str, Any]) -> str:
+    """
+    Format the radical section of a kanji.
+
+    Args:
+        radical: The 'radical' object of a detail response
+
+    Returns:
+        Markdown section, or an empty string if there is no radical data
+    """
+    if not radical:
+        return ""
+    rad_name = radical.get('name', _EMPTY_MAPPING)
+    rad_meaning = radical.get('meaning', _EMPTY_MAPPING).get('english', 'N/A')
+    rad_position = radical.get('position', _EMPTY_MAPPING).get('hiragana', '')
+    position_line = f"- **Position:** {rad_position}\n" if rad_position else ""
+
+    return (
+        f"## Radical\n\n"
+        f"- **Character:** {radical.get('character', 'N/A')}\n"
+        f"- **Meaning:** {_escape_markdown(rad_meaning)}\n"
+        f"- **Name:** {rad_name.get('hiragana', 'N/A')} "
+        f"({_escape_markdown(rad_name.get('romaji', 'N/A'))})\n"
+        f"- **Strokes:** {radical.get('strokes', 'N/A')}\n"
+        f"{position_line}\n"
+    )
+
+
+def _format_detail_references(refs: Mapping[str, Any]) -> str:
+    """
+    Format the dictionary references section of a kanji.
+
+    Args:
+        refs: The 'references' object of a detail response
+
+    Returns:
+        Markdown section, or an empty string if there are no references
+    """
+    if not refs:
+        return ""
+    kodansha = refs.get('kodansha')
+    classic_nelson = refs.get('classic_nelson')
+    return "".join((
+        "## Dictionary References\n\n",
+        f"- **Kodansha:** {kodansha}\n" if kodansha else "",
+        f"- **Classic Nelson:** {classic_nelson}\n" if classic_nelson else "",
+        "\n",
+    ))
+
+
+def _format_detail_examples(examples: List[Dict[str, Any]]) -> str:
+    """
+    Format the example words section of a kanji.
+
+    Only the first MAX_DETAIL_EXAMPLES entries are shown to keep
+    responses manageable; the remainder is summarized in a footer.
 
-        for ex in display_examples:
-            japanese = ex.get('japanese', '')
-            meaning_en = ex.get('meaning', {}).get('english', '')
-            audio = ex.get('audio', {})
-            # Use mp3 format only for audio
-            audio_url = audio.get('mp3', '')
+    Args:
+        examples: The 'examples' list of a detail response
+
+    Returns:
+        Markdown section, or an empty string if there are no examples
+    """
+    if not examples:
+        return ""
+    total_examples = len(examples)
+
+    if total_examples > MAX_DETAIL_EXAMPLES:
+        parts = [f"## Example Words (showing {MAX_DETAIL_EXAMPLES} of {total_examples})\n\n"]
+    else:
+        parts = ["## Example Words\n\n"]
+
+    for ex in examples[:MAX_DETAIL_EXAMPLES]:
+        japanese = ex.get('japanese', '')
+        meaning_en = ex.get('meaning', _EMPTY_MAPPING).get('english', '')
+        # Use mp3 format only for audio
+        audio_url = ex.get('audio', _EMPTY_MAPPING).get('mp3', '')
+
+        parts.append(f"### {_escape_markdown(japanese)}\n")
+        parts.append(f"**Meaning:** {_escape_markdown(meaning_en)}\n")
+        if audio_url:
+            parts.append(f"**Audio:** <{audio_url}>\n")
+        parts.append("\n")
+
+    if total_examples > MAX_DETAIL_EXAMPLES:
+        parts.append(f"*... and {total_examples - MAX_DETAIL_EXAMPLES} more examples not shown.*\n\n")
+
+    return "".join(parts)
+
+
+def _format_kanji_detail_markdown(kanji: Dict[str, Any]) -> str:
+    """
+    Format detailed kanji information in markdown.
 
-            output += f"### {_escape_markdown(japanese)}\n"
-            output += f"**Meaning:** {_escape_markdown(meaning_en)}\n"
-            if audio_url:
-                output += f"**Audio:** <{audio_url}>\n"
-            output += "\n"
+    Args:
+        kanji: Kanji object from the API
 
-        if total_examples > MAX_EXAMPLES:
-            output += f"*... and {total_examples - MAX_EXAMPLES} more examples not shown.*\n\n"
+    Returns:
+        Markdown-formatted string with comprehensive kanji details
+    """
+    k_info = kanji.get('kanji', _EMPTY_MAPPING)
+    refs = kanji.get('references', _EMPTY_MAPPING)
 
-    return output
+    return "".join((
+        _format_detail_basic(k_info, refs),
+        _format_detail_readings(k_info),
+        _format_detail_radical(kanji.get('radical', _EMPTY_MAPPING)),
+        _format_detail_references(refs),
+        _format_detail_examples(kanji.get('examples', [])),
+    ))
 
 
 def _extract_fields_from_results(results: List[Dict[str, Any]]) -> List[str]:
@@ -1104,20 +1655,14 @@ def _extract_fields_from_results(results: List[Dict[str, Any]]) -> List[str]:
     Returns:
         List of unique top-level field names found in results
     """
-    if not results:
-        return []
-    
-    fields = set()
-    for kanji in results:
-        fields.update(kanji.keys())
-    
-    return sorted(fields)
+    # Iterating a dict yields its keys, so one C-level union covers every result
+    return sorted(set().union(*results))
 
 
 def _create_search_metadata(
     results: List[Dict[str, Any]],
     query_params: Dict[str, Any],
-    request_info: Dict[str, Any]
+    request_info: RequestInfo
 ) -> SearchResultMetadata:
     """
     Create metadata object for search results.
@@ -1130,15 +1675,54 @@ def _create_search_metadata(
     Returns:
         SearchResultMetadata object with result information
     """
-    return SearchResultMetadata(
+    # All values are produced internally, so skip re-validating them
+    return SearchResultMetadata.model_construct(
         results_returned=len(results),
         fields_included=_extract_fields_from_results(results),
-        timestamp=request_info['timestamp'],
+        timestamp=request_info.timestamp,
         query_parameters=query_params
     )
 
 
 
+class _LazyModelDump:
+    """
+    Defer dumping tool params in error logs until a handler formats them.
+
+    The default log format ignores 'extra' fields, so dumping the model
+    eagerly on every tool error would usually be wasted work.
+    """
+    __slots__ = ('_model',)
+
+    def __init__(self, model: BaseModel):
+        self._model = model
+
+    def __str__(self) -> str:
+        return json.dumps(self._model.model_dump(), ensure_ascii=False)
+
+    __repr__ = __str__
+
+
+def _compact_tool_result(output: BaseModel) -> CallToolResult:
+    """
+    Wrap tool output in a result whose text content is compact JSON.
+
+    FastMCP renders a returned model as JSON text indented by two spaces.
+    The consumer is an LLM, so the whitespace only costs tokens; returning
+    a CallToolResult keeps the structured content and sends compact text.
+
+    Args:
+        output: Tool output model
+
+    Returns:
+        CallToolResult with compact JSON text and the structured content
+    """
+    return CallToolResult(
+        content=[TextContent(type="text", text=output.model_dump_json())],
+        structuredContent=output.model_dump(mode="json")
+    )
+
+
 @mcp.tool(
     name="kanjialive_search_basic",
     title="Basic Kanji Search",
@@ -1149,7 +1733,10 @@ def _create_search_metadata(
         "openWorldHint": True
     }
 )
-async def kanjialive_search_basic(params: KanjiBasicSearchInput, ctx: Context) -> KanjiSearchOutput:
+async def kanjialive_search_basic(
+    params: KanjiBasicSearchInput,
+    ctx: Context
+) -> Annotated[CallToolResult, KanjiSearchOutput]:
     """
     Search for kanji using a simple search term.
 
@@ -1170,23 +1757,16 @@ async def kanjialive_search_basic(params: KanjiBasicSearchInput, ctx: Context) -
         ctx: MCP context for logging and accessing lifespan resources
 
     Returns:
-        KanjiSearchOutput: Structured search results with metadata
+        CallToolResult: Structured search results with metadata (KanjiSearchOutput)
     """
     try:
         # Get HTTP client from lifespan context
         client = ctx.request_context.lifespan_context.client
 
         await ctx.info(f"Basic search: {params.query}")
-        encoded_query = quote(params.query, safe='')
+        encoded_query = _quote_path_segment(params.query)
         results, request_info = await _make_api_request(client, f"search/{encoded_query}")
 
-        # Validate not empty for non-search terms
-        _validate_response_not_empty(results, f"query '{params.query}'")
-
-        # Ensure results is a list
-        if not isinstance(results, list):
-            results = [results]
-
         # Create metadata for this search
         metadata = _create_search_metadata(
             results=results,
@@ -1196,7 +1776,7 @@ async def kanjialive_search_basic(params: KanjiBasicSearchInput, ctx: Context) -
 
         await ctx.info(f"Basic search returned {metadata.results_returned} results")
 
-        return KanjiSearchOutput(metadata=metadata, results=results)
+        return _compact_tool_result(KanjiSearchOutput(metadata=metadata, results=results))
 
     except Exception as e:
         await ctx.error(f"Tool execution error: {type(e).__name__}")
@@ -1205,7 +1785,7 @@ async def kanjialive_search_basic(params: KanjiBasicSearchInput, ctx: Context) -
             exc_info=True,
             extra={
                 "tool": "kanjialive_search_basic",
-                "params": params.model_dump()
+                "params": _LazyModelDump(params)
             }
         )
         _handle_api_error(e)
@@ -1221,7 +1801,10 @@ async def kanjialive_search_basic(params: KanjiBasicSearchInput, ctx: Context) -
         "openWorldHint": True
     }
 )
-async def kanjialive_search_advanced(params: KanjiAdvancedSearchInput, ctx: Context) -> KanjiSearchOutput:
+async def kanjialive_search_advanced(
+    params: KanjiAdvancedSearchInput,
+    ctx: Context
+) -> Annotated[CallToolResult, KanjiSearchOutput]:
     """
     Search for kanji using multiple filter criteria.
 
@@ -1250,36 +1833,30 @@ async def kanjialive_search_advanced(params: KanjiAdvancedSearchInput, ctx: Cont
         ctx: MCP context for logging and accessing lifespan resources
 
     Returns:
-        KanjiSearchOutput: Structured search results with metadata
+        CallToolResult: Structured search results with metadata (KanjiSearchOutput)
     """
     try:
         # Get HTTP client from lifespan context
         client = ctx.request_context.lifespan_context.client
 
-        if not params.has_any_filter():
+        # Every field is a filter, and only explicitly provided fields can be
+        # non-None, so walk model_fields_set rather than dumping all eleven fields.
+        # Sorted to match the query string order; an empty dict means no filters.
+        query_params = {
+            name: value
+            for name in sorted(params.model_fields_set)
+            if (value := getattr(params, name)) is not None
+        }
+        if not query_params:
             raise ToolError(
                 "At least one search parameter must be provided. "
                 "Available parameters: on, kun, kem, ks, kanji, rjn, rem, rs, rpos, grade, list. "
                 "For simple searches, use kanjialive_search_basic instead."
             )
 
-        # Build query parameters from all non-None fields
-        all_fields = ['on', 'kun', 'kem', 'ks', 'kanji', 'rjn', 'rem', 'rs', 'rpos', 'grade', 'list']
-        query_params = {
-            field: getattr(params, field)
-            for field in all_fields
-            if getattr(params, field) is not None
-        }
-
         await ctx.info(f"Advanced search: {query_params}")
         results, request_info = await _make_api_request(client, "search/advanced", params=query_params)
 
-        # Ensure results is a list (empty list is valid for no matches)
-        if not results:
-            results = []
-        elif not isinstance(results, list):
-            results = [results]
-
         # Create metadata for this search
         metadata = _create_search_metadata(
             results=results,
@@ -1292,7 +1869,7 @@ async def kanjialive_search_advanced(params: KanjiAdvancedSearchInput, ctx: Cont
             f"matching criteria {query_params}"
         )
 
-        return KanjiSearchOutput(metadata=metadata, results=results)
+        return _compact_tool_result(KanjiSearchOutput(metadata=metadata, results=results))
 
     except ToolError:
         # Re-raise ToolError as-is (it's already properly formatted)
@@ -1304,12 +1881,33 @@ async def kanjialive_search_advanced(params: KanjiAdvancedSearchInput, ctx: Cont
             exc_info=True,
             extra={
                 "tool": "kanjialive_search_advanced",
-                "params": params.model_dump()
+                "params": _LazyModelDump(params)
             }
         )
         _handle_api_error(e)
 
 
+# Documented fields kept by _filter_kanji_detail_response
+_KANJI_DETAIL_FIELDS = frozenset({'character', 'meaning', 'strokes', 'onyomi', 'kunyomi', 'video'})
+_EXAMPLE_FIELDS = frozenset({'japanese', 'meaning', 'audio'})
+
+
+def _drop_undocumented_keys(data: Dict[str, Any], allowed: frozenset) -> Dict[str, Any]:
+    """
+    Remove keys outside the allowed set, and null values, from a dict in place.
+
+    Args:
+        data: Dictionary to filter (mutated)
+        allowed: Keys to keep
+
+    Returns:
+        The same dictionary, for use in comprehensions
+    """
+    for key in [k for k, v in data.items() if v is None or k not in allowed]:
+        del data[key]
+    return data
+
+
 def _filter_kanji_detail_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Filter raw API response to match the documented Kanji Alive API format.
@@ -1326,6 +1924,12 @@ def _filter_kanji_detail_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     - references: grade, kodansha, classic_nelson
     - examples: japanese, meaning, audio
 
+    Documented fields whose value is null are omitted.
+
+    The nested 'kanji' and 'examples' objects are filtered in place, so
+    raw_data must be a private copy that the caller no longer needs
+    (_make_api_request returns a fresh copy on every call).
+
     Args:
         raw_data: Raw API response from Kanji Alive
 
@@ -1334,61 +1938,82 @@ def _filter_kanji_detail_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     filtered = {}
 
-    # Extract and filter the 'kanji' object to documented fields only
-    if 'kanji' in raw_data and isinstance(raw_data['kanji'], dict):
-        kanji_raw = raw_data['kanji']
-        kanji_filtered = {}
-
-        if 'character' in kanji_raw:
-            kanji_filtered['character'] = kanji_raw['character']
-        if 'meaning' in kanji_raw:
-            kanji_filtered['meaning'] = kanji_raw['meaning']
+    # Filter the 'kanji' object down to documented fields only
+    kanji_raw = raw_data.get('kanji')
+    if isinstance(kanji_raw, dict):
+        _drop_undocumented_keys(kanji_raw, _KANJI_DETAIL_FIELDS)
 
         # strokes: API returns object {count, timings, images}, docs show integer
-        if 'strokes' in kanji_raw:
-            strokes = kanji_raw['strokes']
-            if isinstance(strokes, dict):
-                kanji_filtered['strokes'] = strokes.get('count')
-            else:
-                kanji_filtered['strokes'] = strokes
+        strokes = kanji_raw.get('strokes')
+        if isinstance(strokes, dict):
+            kanji_raw['strokes'] = strokes.get('count')
 
-        if 'onyomi' in kanji_raw:
-            kanji_filtered['onyomi'] = kanji_raw['onyomi']
-        if 'kunyomi' in kanji_raw:
-            kanji_filtered['kunyomi'] = kanji_raw['kunyomi']
-        if 'video' in kanji_raw:
-            kanji_filtered['video'] = kanji_raw['video']
-
-        filtered['kanji'] = kanji_filtered
+        filtered['kanji'] = kanji_raw
 
     # Extract the 'radical' object (already matches documented format)
-    if 'radical' in raw_data and isinstance(raw_data['radical'], dict):
-        filtered['radical'] = raw_data['radical']
+    radical = raw_data.get('radical')
+    if isinstance(radical, dict):
+        filtered['radical'] = radical
 
     # Extract references
-    if 'references' in raw_data and isinstance(raw_data['references'], dict):
-        filtered['references'] = raw_data['references']
+    references = raw_data.get('references')
+    if isinstance(references, dict):
+        filtered['references'] = references
 
     # Extract examples array with only documented fields
-    if 'examples' in raw_data and isinstance(raw_data['examples'], list):
-        filtered_examples = []
-        for example in raw_data['examples']:
-            if isinstance(example, dict):
-                filtered_example = {}
-                if 'japanese' in example:
-                    filtered_example['japanese'] = example['japanese']
-                if 'meaning' in example:
-                    filtered_example['meaning'] = example['meaning']
-                if 'audio' in example:
-                    filtered_example['audio'] = example['audio']
-                if filtered_example:
-                    filtered_examples.append(filtered_example)
+    examples = raw_data.get('examples')
+    if isinstance(examples, list):
+        # Keep only examples that still have documented fields after filtering
+        filtered_examples = [
+            example
+            for example in examples
+            if isinstance(example, dict) and _drop_undocumented_keys(example, _EXAMPLE_FIELDS)
+        ]
         if filtered_examples:
             filtered['examples'] = filtered_examples
 
     return filtered
 
 
+async def _get_kanji_detail_data(
+    client: httpx.AsyncClient,
+    character: str
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Fetch and filter the details for one kanji, serving repeats from cache.
+
+    Args:
+        client: HTTP client from lifespan context
+        character: Validated, normalized kanji character
+
+    Returns:
+        Tuple of (kanji_data, timestamp) where kanji_data is the filtered
+        detail response and timestamp is the ISO time of the request
+
+    Raises:
+        httpx.HTTPStatusError: If the API returns an error status code
+        httpx.TimeoutException: If the request times out
+        ValueError: If the API returns an empty or malformed response
+    """
+    # Serve previously filtered details without copying and re-filtering the raw response
+    kanji_data = _lru_get(_DETAIL_CACHE, character)
+    if kanji_data is not None:
+        _CACHE_STATS["detail_hits"] += 1
+        return kanji_data, _current_timestamp()
+    _CACHE_STATS["detail_misses"] += 1
+
+    # The filtered result goes in _DETAIL_CACHE, so skip caching the full raw
+    # payload (stroke timings, media URLs) where it would evict search results
+    raw_data, request_info = await _make_api_request(
+        client, f"kanji/{character}", cache_response=False
+    )
+
+    # Filter to documented fields only (removes internal DB fields, restricted data)
+    kanji_data = _filter_kanji_detail_response(raw_data)
+    _lru_put(_DETAIL_CACHE, character, kanji_data, DETAIL_CACHE_SIZE)
+    return kanji_data, request_info.timestamp
+
+
 @mcp.tool(
     name="kanjialive_get_kanji_details",
     title="Get Kanji Details",
@@ -1399,7 +2024,10 @@ def _filter_kanji_detail_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         "openWorldHint": True
     }
 )
-async def kanjialive_get_kanji_details(params: KanjiDetailInput, ctx: Context) -> KanjiDetailOutput:
+async def kanjialive_get_kanji_details(
+    params: KanjiDetailInput,
+    ctx: Context
+) -> Annotated[CallToolResult, KanjiDetailOutput]:
     """
     Get comprehensive information about a specific kanji character.
 
@@ -1423,7 +2051,8 @@ async def kanjialive_get_kanji_details(params: KanjiDetailInput, ctx: Context) -
         ctx: MCP context for logging and accessing lifespan resources
 
     Returns:
-        KanjiDetailOutput: Comprehensive kanji information including readings, radical, examples
+        CallToolResult: Comprehensive kanji information including readings, radical,
+            examples (KanjiDetailOutput)
 
     Example usage:
         - Get details for 親: character="親"
@@ -1435,21 +2064,15 @@ async def kanjialive_get_kanji_details(params: KanjiDetailInput, ctx: Context) -
         client = ctx.request_context.lifespan_context.client
 
         await ctx.info(f"Get kanji details: {params.character}")
-        raw_data, request_info = await _make_api_request(client, f"kanji/{params.character}")
-
-        # Validate not empty
-        _validate_response_not_empty(raw_data, f"kanji '{params.character}'")
-
-        # Filter to documented fields only (removes internal DB fields, restricted data)
-        kanji_data = _filter_kanji_detail_response(raw_data)
+        kanji_data, timestamp = await _get_kanji_detail_data(client, params.character)
 
-        return KanjiDetailOutput(
-            metadata=KanjiDetailMetadata(
-                timestamp=request_info['timestamp'],
-                endpoint=request_info['endpoint']
+        return _compact_tool_result(KanjiDetailOutput(
+            metadata=KanjiDetailMetadata.model_construct(
+                timestamp=timestamp,
+                endpoint=f"kanji/{params.character}"
             ),
             kanji=kanji_data
-        )
+        ))
 
     except Exception as e:
         await ctx.error(f"Tool execution error: {type(e).__name__}")
@@ -1458,12 +2081,110 @@ async def kanjialive_get_kanji_details(params: KanjiDetailInput, ctx: Context) -
             exc_info=True,
             extra={
                 "tool": "kanjialive_get_kanji_details",
-                "params": params.model_dump()
+                "params": _LazyModelDump(params)
             }
         )
         _handle_api_error(e)
 
 
+@mcp.tool(
+    name="kanjialive_get_kanji_details_batch",
+    title="Get Kanji Details (Batch)",
+    annotations={
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True
+    }
+)
+async def kanjialive_get_kanji_details_batch(
+    params: KanjiDetailBatchInput,
+    ctx: Context
+) -> Annotated[CallToolResult, KanjiDetailBatchOutput]:
+    """
+    Get comprehensive information about several kanji characters in one call.
+
+    This tool returns the same information as kanjialive_get_kanji_details for
+    each requested character, fetching them concurrently. Use it when you need
+    details for every kanji in a compound word or sentence, instead of calling
+    kanjialive_get_kanji_details once per character.
+
+    A failed lookup does not fail the whole batch: its entry has a null 'kanji'
+    and an 'error' message explaining what went wrong.
+
+    Args:
+        params (KanjiDetailBatchInput): Parameters containing:
+            - characters (List[str]): The kanji characters to look up
+        ctx: MCP context for logging and accessing lifespan resources
+
+    Returns:
+        CallToolResult: One result per requested character, in request order
+            (KanjiDetailBatchOutput)
+
+    Example usage:
+        - Get details for 親切: characters=["親", "切"]
+        - Get details for 日本語: characters=["日", "本", "語"]
+    """
+    try:
+        # Get HTTP client from lifespan context
+        client = ctx.request_context.lifespan_context.client
+
+        await ctx.info(f"Get kanji details (batch): {''.join(params.characters)}")
+
+        # Bound concurrent upstream requests to respect RapidAPI rate limits
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def fetch(character: str) -> Tuple[Dict[str, Any], str]:
+            async with semaphore:
+                return await _get_kanji_detail_data(client, character)
+
+        # Look up each distinct character once, in first-seen order
+        unique_characters = list(dict.fromkeys(params.characters))
+        outcomes = await asyncio.gather(
+            *(fetch(c) for c in unique_characters),
+            return_exceptions=True
+        )
+
+        items: Dict[str, KanjiDetailBatchItem] = {}
+        for character, outcome in zip(unique_characters, outcomes):
+            if isinstance(outcome, BaseException):
+                # Reuse the single-lookup error messages for the failed entry
+                try:
+                    _handle_api_error(outcome)
+                except ToolError as te:
+                    items[character] = KanjiDetailBatchItem(character=character, error=str(te))
+            else:
+                kanji_data, _ = outcome
+                items[character] = KanjiDetailBatchItem(character=character, kanji=kanji_data)
+
+        # Map back to the requested positions, repeating results for duplicates
+        results = [items[c] for c in params.characters]
+
+        metadata = KanjiDetailBatchMetadata.model_construct(
+            timestamp=_current_timestamp(),
+            characters_requested=len(params.characters),
+            characters_found=sum(1 for r in results if r.error is None)
+        )
+
+        await ctx.info(
+            f"Batch details returned {metadata.characters_found} "
+            f"of {metadata.characters_requested} kanji"
+        )
+
+        return _compact_tool_result(KanjiDetailBatchOutput(metadata=metadata, results=results))
+
+    except Exception as e:
+        await ctx.error(f"Tool execution error: {type(e).__name__}")
+        logger.error(
+            f"Tool execution error: {type(e).__name__}",
+            exc_info=True,
+            extra={
+                "tool": "kanjialive_get_kanji_details_batch",
+                "params": _LazyModelDump(params)
+            }
+        )
+        _handle_api_error(e)
+
 
 @mcp.resource("kanjialive://info/radicals")
 async def radicals_resource() -> str:
@@ -1495,15 +2216,44 @@ async def radicals_resource() -> str:
     - Identify important radicals for study prioritization
     """
     try:
-        radicals_data = _get_radicals_cache()
-        return json.dumps(radicals_data, ensure_ascii=False, indent=2)
+        return _get_radicals_json()
     except RuntimeError as e:
         # This should never happen if server started correctly
         logger.error(f"Radicals cache access failed: {e}")
         return json.dumps({
             "error": str(e),
             "hint": "The server may not have initialized correctly. Check startup logs."
-        }, ensure_ascii=False, indent=2)
+        }, ensure_ascii=False, separators=(',', ':'))
+
+
+
+@mcp.resource("kanjialive://info/cache-stats")
+async def cache_stats_resource() -> str:
+    """
+    Hit/miss counters and current sizes of the server's in-memory caches.
+
+    The response cache holds raw search responses keyed by endpoint and
+    query parameters; the detail cache holds filtered kanji details keyed
+    by character. Entries expire after ttl_seconds.
+
+    Use this resource to check how often repeated lookups are served
+    without calling the Kanji Alive API.
+    """
+    return json.dumps({
+        "ttl_seconds": CACHE_TTL,
+        "response_cache": {
+            "size": len(_RESPONSE_CACHE),
+            "max_size": RESPONSE_CACHE_SIZE,
+            "hits": _CACHE_STATS["response_hits"],
+            "misses": _CACHE_STATS["response_misses"],
+        },
+        "detail_cache": {
+            "size": len(_DETAIL_CACHE),
+            "max_size": DETAIL_CACHE_SIZE,
+            "hits": _CACHE_STATS["detail_hits"],
+            "misses": _CACHE_STATS["detail_misses"],
+        },
+    }, separators=(',', ':'))
 
 
 